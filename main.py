@@ -61,6 +61,11 @@ DEFAULT_BUS_DATA_WORKSHEET_NAME = 'Bus data'
 DEFAULT_LINE_DATA_WORKSHEET_NAME = 'Line data'
 
 # Power flow constants.
+DEFAULT_SOLVER_METHOD = 'newton-raphson'
+SOLVER_METHODS = {
+    'newton-raphson': power_flow_solver.SolverMethod.NEWTON_RAPHSON,
+    'fast-decoupled': power_flow_solver.SolverMethod.FAST_DECOUPLED,
+}
 DEFAULT_SWING_BUS_NUMBER = 1
 DEFAULT_START_VOLTAGE = 1 + 0j
 DEFAULT_POWER_BASE = 100
@@ -84,6 +89,8 @@ def parse_arguments():
     parser.add_argument('--line_data_worksheet', default=DEFAULT_LINE_DATA_WORKSHEET_NAME,
                         help='The name of the worksheet containing line data.')
     parser.add_argument('--swing_bus_number', type=int, default=DEFAULT_SWING_BUS_NUMBER, help='The swing bus number.')
+    parser.add_argument('--solver_method', choices=sorted(SOLVER_METHODS), default=DEFAULT_SOLVER_METHOD,
+                        help='The solution method to iterate with.')
     parser.add_argument('--start_voltage_magnitude', type=float, default=numpy.abs(DEFAULT_START_VOLTAGE),
                         help='The initial voltage magnitude in volts to use when solving the power flow.')
     parser.add_argument('--start_voltage_angle', type=float, default=numpy.rad2deg(numpy.angle(DEFAULT_START_VOLTAGE)),
@@ -113,7 +120,8 @@ def main():
     # Initialize the power flow.
     solver = power_flow_solver.PowerFlowSolver(system, args.swing_bus_number,
                                                args.max_active_power_error / args.power_base,
-                                               args.max_reactive_power_error / args.power_base)
+                                               args.max_reactive_power_error / args.power_base,
+                                               method=SOLVER_METHODS[args.solver_method])
 
     # Iterate towards a solution.
     iteration = 1
@@ -13,12 +13,69 @@ directly modified and updated at each iteration.
 import dataclasses
 import enum
 import numpy
+import os
 import power_system
+import scipy.linalg
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 DEFAULT_SWING_BUS_NUMBER = 1
 DEFAULT_MAX_ACTIVE_POWER_ERROR = 0.001
 DEFAULT_MAX_REACTIVE_POWER_ERROR = 0.001
 
+# Set this environment variable to any non-empty value to force the pure NumPy code paths even when numba is
+# installed.
+DISABLE_NUMBA_ENV_VAR = 'POWER_FLOW_DISABLE_NUMBA'
+
+_NUMBA_ENABLED = numba is not None and not os.environ.get(DISABLE_NUMBA_ENV_VAR)
+
+# Rows of the derivative matrices are independent, so the compiled kernel distributes them across threads. The thread
+# count can be limited with the standard NUMBA_NUM_THREADS environment variable.
+_prange = numba.prange if _NUMBA_ENABLED else range
+
+
+def _power_derivative_matrices(voltages, currents, admittance_pointers, admittance_indices, admittance_values):
+    """Computes the complex power derivative matrices from the admittance matrix in compressed sparse row form.
+
+    This is the scalar-loop form of the identities documented in PowerFlowSolver._power_derivatives, written so that
+    numba can compile it to native code. Both derivative matrices share the sparsity pattern of the admittance matrix
+    plus its diagonal, so only entries with a matching non-zero admittance are visited.
+
+    Args:
+        voltages: The complex voltage at each bus.
+        currents: The complex current injection at each bus.
+        admittance_pointers: The CSR row pointers of the admittance matrix.
+        admittance_indices: The CSR column indices of the admittance matrix.
+        admittance_values: The CSR non-zero values of the admittance matrix.
+
+    Returns:
+        A tuple of the angle and magnitude derivative matrices over all buses.
+    """
+    n = len(voltages)
+    ds_dtheta = numpy.zeros((n, n), dtype=voltages.dtype)
+    ds_dmagnitude = numpy.zeros((n, n), dtype=voltages.dtype)
+    for k in _prange(n):
+        v_k = voltages[k]
+        u_k = v_k / abs(v_k)
+        ds_dtheta[k, k] = 1j * v_k * numpy.conj(currents[k])
+        ds_dmagnitude[k, k] = u_k * numpy.conj(currents[k])
+
+        for index in range(admittance_pointers[k], admittance_pointers[k + 1]):
+            j = admittance_indices[index]
+            y_kj = admittance_values[index]
+            u_j = voltages[j] / abs(voltages[j])
+            ds_dtheta[k, j] += -1j * v_k * numpy.conj(y_kj * voltages[j])
+            ds_dmagnitude[k, j] += v_k * numpy.conj(y_kj * u_j)
+
+    return ds_dtheta, ds_dmagnitude
+
+
+if _NUMBA_ENABLED:
+    _power_derivative_matrices = numba.njit(cache=True, fastmath=True, parallel=True)(_power_derivative_matrices)
+
 
 class BusType(enum.Enum):
     """Bus type enumerations."""
@@ -28,6 +85,12 @@ class BusType(enum.Enum):
     PQ = 3
 
 
+class SolverMethod(enum.Enum):
+    """Solution method enumerations."""
+    NEWTON_RAPHSON = 0
+    FAST_DECOUPLED = 1
+
+
 @dataclasses.dataclass(frozen=True)
 class _BusEstimate:
     """A bus estimate object. This object contains estimated power values."""
@@ -44,7 +107,8 @@ class PowerFlowSolver:
 
     def __init__(self, system, swing_bus_number=DEFAULT_SWING_BUS_NUMBER,
                  max_active_power_error=DEFAULT_MAX_ACTIVE_POWER_ERROR,
-                 max_reactive_power_error=DEFAULT_MAX_REACTIVE_POWER_ERROR):
+                 max_reactive_power_error=DEFAULT_MAX_REACTIVE_POWER_ERROR,
+                 method=SolverMethod.NEWTON_RAPHSON, dtype=numpy.float64):
         """Initializes the power flow solver.
 
         Args:
@@ -52,15 +116,36 @@ class PowerFlowSolver:
             swing_bus_number: The bus designated as the swing bus.
             max_active_power_error: The maximum allowed active power mismatch.
             max_reactive_power_error: The maximum allowed reactive power mismatch.
+            method: The solution method to iterate with.
+            dtype: The real floating point type to compute with. Single precision halves memory traffic and is
+                usually sufficient for the default tolerances; the solver promotes itself back to double precision
+                if the mismatches stop decreasing.
         """
         self._system = system
         self._swing_bus_number = swing_bus_number
         self._max_active_power_error = max_active_power_error
         self._max_reactive_power_error = max_reactive_power_error
-
-        self._admittance_matrix = system.admittance_matrix()
+        self._method = method
+        self._dtype = numpy.dtype(dtype)
+        self._complex_dtype = numpy.result_type(self._dtype, numpy.complex64)
+        self._previous_mismatch = numpy.inf
+
+        self._admittance_matrix = system.admittance_matrix(sparse=True).astype(self._complex_dtype)
+        self._bus_index = {bus.number: index for index, bus in enumerate(system.buses)}
+        self._bus_types = [self._bus_type(bus) for bus in system.buses]
+        self._scheduled_active_powers = numpy.array(
+            [bus.active_power_generated - bus.active_power_consumed for bus in system.buses], dtype=self._dtype)
+        self._scheduled_reactive_powers = numpy.array([-bus.reactive_power_consumed for bus in system.buses],
+                                                      dtype=self._dtype)
+        self._voltages = numpy.array([bus.voltage for bus in system.buses], dtype=self._complex_dtype)
+        self._magnitudes = numpy.abs(self._voltages)
+        self._angles = numpy.angle(self._voltages)
+        self._currents = self._admittance_matrix @ self._voltages
         self._compute_estimates()
 
+        if self._method == SolverMethod.FAST_DECOUPLED:
+            self._factor_decoupled_matrices()
+
     @property
     def estimates(self):
         """Returns the current bus power estimates."""
@@ -73,30 +158,41 @@ class PowerFlowSolver:
             True if the power injection estimates at each bus are equal to the actual power injection (within some
             allowable margin), false otherwise.
         """
-        max_dp = numpy.max([numpy.abs(i.active_power_error) for i in self._pv_pq_estimates.values()])
-        max_dq = numpy.max([numpy.abs(i.reactive_power_error) for i in self._pq_estimates.values()])
+        max_dp = numpy.abs(self._active_power_errors[self._pv_pq_indices]).max()
+        max_dq = numpy.abs(self._reactive_power_errors[self._pq_indices]).max()
         return max_dp <= self._max_active_power_error and max_dq <= self._max_reactive_power_error
 
     def step(self):
-        """Executes a step of the power flow analysis using the Newton-Raphson method.
+        """Executes a step of the power flow analysis.
 
         The following steps are performed:
 
-            1. Compute the Jacobian for the estimated system.
-            2. Execute the Newton-Raphson method to obtain a set of voltage magnitude and phase angle corrections.
-            3. Apply the corrections to each bus.
-            4. Compute bus power estimates using the explicit power equations.
+            1. Obtain a set of voltage magnitude and phase angle corrections, either from a Newton-Raphson iteration
+               or from the constant fast-decoupled factorizations.
+            2. Apply the corrections to each bus.
+            3. Compute bus power estimates using the explicit power equations.
         """
-        jacobian = self._jacobian()
-        corrections = self._compute_corrections(jacobian)
+        if self._method == SolverMethod.FAST_DECOUPLED:
+            corrections = self._fast_decoupled_corrections()
+        else:
+            corrections = self._compute_corrections(self._jacobian())
+
         self._apply_corrections(corrections)
         self._compute_estimates()
 
+        mismatch = max(numpy.abs(self._active_power_errors[self._pv_pq_indices]).max(),
+                       numpy.abs(self._reactive_power_errors[self._pq_indices]).max())
+        if self._dtype == numpy.float32 and not self.has_converged() and mismatch >= self._previous_mismatch:
+            self._promote_to_double_precision()
+        self._previous_mismatch = mismatch
+
     def _compute_estimates(self):
         """Computes power injection estimates for each bus and splits out PV/PQ and PQ buses."""
         self._estimates = self._bus_power_estimates()
         self._pv_pq_estimates = {i.bus.number: i for i in self._estimates.values() if i.bus_type != BusType.SWING}
         self._pq_estimates = {i.bus.number: i for i in self._estimates.values() if i.bus_type == BusType.PQ}
+        self._pv_pq_indices = self._estimate_indices(self._pv_pq_estimates)
+        self._pq_indices = self._estimate_indices(self._pq_estimates)
 
     def _bus_type(self, bus):
         """Classifies a given bus based on which parameters specify it.
@@ -124,159 +220,108 @@ class PowerFlowSolver:
         Returns:
             A dict mapping a bus number to its power injection estimate.
         """
+        powers = self._voltages * numpy.conj(self._currents)
+        p = powers.real
+        q = powers.imag
+        p_errors = self._scheduled_active_powers - p
+        q_errors = self._scheduled_reactive_powers - q
+        self._active_power_errors = p_errors
+        self._reactive_power_errors = q_errors
+
         estimates = {}
-        for index_src, src in enumerate(self._system.buses):
-            bus_type = self._bus_type(src)
-            p = 0
-            q = 0
-            v_k = numpy.abs(src.voltage)
-            theta_k = numpy.angle(src.voltage)
-
-            for index_dst, dst in enumerate(self._system.buses):
-                v_i = numpy.abs(dst.voltage)
-                theta_i = numpy.angle(dst.voltage)
-                y_ki = self._admittance_matrix[index_src][index_dst]
-                g_ki = y_ki.real
-                b_ki = y_ki.imag
-                theta_ki = theta_k - theta_i
-
-                p += v_k * v_i * (g_ki * numpy.cos(theta_ki) + b_ki * numpy.sin(theta_ki))
-                q += v_k * v_i * (g_ki * numpy.sin(theta_ki) - b_ki * numpy.cos(theta_ki))
-
-            p_error = src.active_power_generated - src.active_power_consumed - p
-            q_error = -src.reactive_power_consumed - q
-            estimates[src.number] = _BusEstimate(src, bus_type, p, q, p_error, q_error)
+        for index, bus in enumerate(self._system.buses):
+            estimates[bus.number] = _BusEstimate(bus, self._bus_types[index], p[index], q[index], p_errors[index],
+                                                 q_errors[index])
 
         return estimates
 
     def _jacobian(self):
         """Computes the Jacobian for the power flow."""
-        j11 = self._jacobian_11()
-        j12 = self._jacobian_12()
-        j21 = self._jacobian_21()
-        j22 = self._jacobian_22()
-        j1 = numpy.concatenate([j11, j12], axis=1)
-        j2 = numpy.concatenate([j21, j22], axis=1)
+        ds_dtheta, ds_dmagnitude = self._power_derivatives()
+        pv_pq_indices = self._pv_pq_indices
+        pq_indices = self._pq_indices
+        j1 = numpy.concatenate([ds_dtheta.real[numpy.ix_(pv_pq_indices, pv_pq_indices)],
+                                ds_dmagnitude.real[numpy.ix_(pv_pq_indices, pq_indices)]], axis=1)
+        j2 = numpy.concatenate([ds_dtheta.imag[numpy.ix_(pq_indices, pv_pq_indices)],
+                                ds_dmagnitude.imag[numpy.ix_(pq_indices, pq_indices)]], axis=1)
         return numpy.concatenate([j1, j2], axis=0)
 
+    def _estimate_indices(self, estimates):
+        """Maps a dict of bus estimates to the positions of their buses in the bus list.
+
+        Args:
+            estimates: A dict mapping bus numbers to estimates.
+
+        Returns:
+            An array of indices into the system bus list.
+        """
+        return numpy.array([self._bus_index[number] for number in estimates])
+
+    def _power_derivatives(self):
+        """Computes the partial derivatives of the bus power injections.
+
+        The derivatives with respect to voltage angle and magnitude are given by the complex matrix identities
+
+            dS/dtheta = j diag(V) conj(diag(I) - Y diag(V))
+            dS/d|V| = diag(V / |V|) conj(diag(I)) + diag(V) conj(Y diag(V / |V|))
+
+        where I = YV. The Jacobian submatrices are the real and imaginary parts of these matrices, restricted to the
+        appropriate PV and PQ buses.
+
+        Returns:
+            A tuple of the angle and magnitude derivative matrices over all buses.
+        """
+        voltages = self._voltages
+        currents = self._currents
+        if _NUMBA_ENABLED:
+            return _power_derivative_matrices(voltages, currents, self._admittance_matrix.indptr,
+                                              self._admittance_matrix.indices, self._admittance_matrix.data)
+
+        unit_voltages = numpy.exp(1j * self._angles)
+        scaled_admittances = self._admittance_matrix.multiply(voltages[None, :]).toarray()
+        unit_scaled_admittances = self._admittance_matrix.multiply(unit_voltages[None, :]).toarray()
+        ds_dtheta = 1j * voltages[:, None] * numpy.conj(numpy.diag(currents) - scaled_admittances)
+        ds_dmagnitude = numpy.diag(unit_voltages * numpy.conj(currents)) + voltages[:, None] * numpy.conj(
+            unit_scaled_admittances)
+        return ds_dtheta, ds_dmagnitude
+
     def _jacobian_11(self):
         """Computes the Jacobian submatrix J11."""
-        j11 = numpy.zeros((len(self._pv_pq_estimates), len(self._pv_pq_estimates)))
-        for row, src_number in enumerate(self._pv_pq_estimates):
-            src = self._pv_pq_estimates[src_number]
-            k = [index for index, bus in enumerate(self._system.buses) if bus.number == src.bus.number][0]
-            v_k = numpy.abs(src.bus.voltage)
-            theta_k = numpy.angle(src.bus.voltage)
-            q_k = src.reactive_power
-
-            for col, dst_number in enumerate(self._pv_pq_estimates):
-                dst = self._pv_pq_estimates[dst_number]
-                j = [index for index, bus in enumerate(self._system.buses) if bus.number == dst.bus.number][0]
-                v_j = numpy.abs(dst.bus.voltage)
-                theta_j = numpy.angle(dst.bus.voltage)
-                theta_kj = theta_k - theta_j
-
-                y_kj = self._admittance_matrix[k][j]
-                g_kj = y_kj.real
-                b_kj = y_kj.imag
-
-                if k != j:
-                    j11[row][col] = v_k * v_j * (g_kj * numpy.sin(theta_kj) - b_kj * numpy.cos(theta_kj))
-                else:
-                    j11[row][col] = -q_k - (v_k ** 2) * b_kj
-
-        return j11
+        ds_dtheta, _ = self._power_derivatives()
+        pv_pq_indices = self._pv_pq_indices
+        return ds_dtheta.real[numpy.ix_(pv_pq_indices, pv_pq_indices)]
 
     def _jacobian_12(self):
         """Computes the Jacobian submatrix J12."""
-        j12 = numpy.zeros((len(self._pv_pq_estimates), len(self._pq_estimates)))
-        for row, src_number in enumerate(self._pv_pq_estimates):
-            src = self._pv_pq_estimates[src_number]
-            k = [index for index, bus in enumerate(self._system.buses) if bus.number == src.bus.number][0]
-            v_k = numpy.abs(src.bus.voltage)
-            theta_k = numpy.angle(src.bus.voltage)
-            p_k = src.active_power
-
-            for col, dst_number in enumerate(self._pq_estimates):
-                dst = self._pq_estimates[dst_number]
-                j = [index for index, bus in enumerate(self._system.buses) if bus.number == dst.bus.number][0]
-                theta_j = numpy.angle(dst.bus.voltage)
-                theta_kj = theta_k - theta_j
-
-                y_kj = self._admittance_matrix[k][j]
-                g_kj = y_kj.real
-                b_kj = y_kj.imag
-
-                if k != j:
-                    j12[row][col] = v_k * (g_kj * numpy.cos(theta_kj) + b_kj * numpy.sin(theta_kj))
-                else:
-                    j12[row][col] = p_k / v_k + g_kj * v_k
-
-        return j12
+        _, ds_dmagnitude = self._power_derivatives()
+        pv_pq_indices = self._pv_pq_indices
+        pq_indices = self._pq_indices
+        return ds_dmagnitude.real[numpy.ix_(pv_pq_indices, pq_indices)]
 
     def _jacobian_21(self):
         """Computes the Jacobian submatrix J21."""
-        j21 = numpy.zeros((len(self._pq_estimates), len(self._pv_pq_estimates)))
-        for row, src_number in enumerate(self._pq_estimates):
-            src = self._pq_estimates[src_number]
-            k = [index for index, bus in enumerate(self._system.buses) if bus.number == src.bus.number][0]
-            v_k = numpy.abs(src.bus.voltage)
-            theta_k = numpy.angle(src.bus.voltage)
-            p_k = src.active_power
-
-            for col, dst_number in enumerate(self._pv_pq_estimates):
-                dst = self._pv_pq_estimates[dst_number]
-                j = [index for index, bus in enumerate(self._system.buses) if bus.number == dst.bus.number][0]
-                v_j = numpy.abs(dst.bus.voltage)
-                theta_j = numpy.angle(dst.bus.voltage)
-                theta_kj = theta_k - theta_j
-
-                y_kj = self._admittance_matrix[k][j]
-                g_kj = y_kj.real
-                b_kj = y_kj.imag
-
-                if k != j:
-                    j21[row][col] = -v_k * v_j * (g_kj * numpy.cos(theta_kj) + b_kj * numpy.sin(theta_kj))
-                else:
-                    j21[row][col] = p_k - g_kj * v_k ** 2
-
-        return j21
+        ds_dtheta, _ = self._power_derivatives()
+        pv_pq_indices = self._pv_pq_indices
+        pq_indices = self._pq_indices
+        return ds_dtheta.imag[numpy.ix_(pq_indices, pv_pq_indices)]
 
     def _jacobian_22(self):
         """Computes the Jacobian submatrix J22."""
-        j22 = numpy.zeros((len(self._pq_estimates), len(self._pq_estimates)))
-        for row, src_number in enumerate(self._pq_estimates):
-            src = self._pq_estimates[src_number]
-            k = [index for index, bus in enumerate(self._system.buses) if bus.number == src.bus.number][0]
-            v_k = numpy.abs(src.bus.voltage)
-            theta_k = numpy.angle(src.bus.voltage)
-            q_k = src.reactive_power
-
-            for col, dst_number in enumerate(self._pq_estimates):
-                dst = self._pq_estimates[dst_number]
-                j = [index for index, bus in enumerate(self._system.buses) if bus.number == dst.bus.number][0]
-                theta_j = numpy.angle(dst.bus.voltage)
-                theta_kj = theta_k - theta_j
-
-                y_kj = self._admittance_matrix[k][j]
-                g_kj = y_kj.real
-                b_kj = y_kj.imag
-
-                if k != j:
-                    j22[row][col] = v_k * (g_kj * numpy.sin(theta_kj) - b_kj * numpy.cos(theta_kj))
-                else:
-                    j22[row][col] = q_k / v_k - b_kj * v_k
-
-        return j22
+        _, ds_dmagnitude = self._power_derivatives()
+        pq_indices = self._pq_indices
+        return ds_dmagnitude.imag[numpy.ix_(pq_indices, pq_indices)]
 
     def _compute_corrections(self, jacobian):
         """Computes corrective factors to apply to voltage phase angles and magnitudes.
 
         This method executes an iteration of the Newton-Raphson method. The state vector is given from the list of
-        active and reactive power injection mismatches, and the corrective factors are computed by multiplying the
-        state vector by the inverse Jacobian.
+        active and reactive power injection mismatches, and the corrective factors are computed by solving the linear
+        system
+
+            J dx = x
 
-            dx = J^(-1)x
+        with an LU factorization, which is both cheaper and better conditioned than forming the inverse Jacobian
+        explicitly.
 
         There are expected to be phase angle corrections for all PV and PQ buses, and magnitude corrections for all PQ
         buses.
@@ -287,11 +332,63 @@ class PowerFlowSolver:
         Returns:
             An ordered list of voltage phase angle and magnitude corrections.
         """
-        p_errors = [i.active_power_error for i in self._pv_pq_estimates.values()]
-        q_errors = [i.reactive_power_error for i in self._pq_estimates.values()]
-        errors = numpy.transpose([p_errors + q_errors])
-        corrections = numpy.matmul(numpy.linalg.inv(jacobian), errors)
-        return corrections.transpose()[0]
+        errors = numpy.concatenate([self._active_power_errors[self._pv_pq_indices],
+                                    self._reactive_power_errors[self._pq_indices]])
+        return scipy.linalg.lu_solve(scipy.linalg.lu_factor(jacobian), errors)
+
+    def _factor_decoupled_matrices(self):
+        """Factors the constant fast-decoupled matrices B' and B''.
+
+        Both matrices are constant across iterations, so they are factored once and reused at every step.
+        """
+        susceptances = self._admittance_matrix.toarray().imag
+        b_prime = -susceptances[numpy.ix_(self._pv_pq_indices, self._pv_pq_indices)]
+        b_double_prime = -susceptances[numpy.ix_(self._pq_indices, self._pq_indices)]
+        self._b_prime_factor = scipy.linalg.lu_factor(b_prime)
+        self._b_double_prime_factor = scipy.linalg.lu_factor(b_double_prime)
+
+    def _promote_to_double_precision(self):
+        """Switches the solver state from single to double precision.
+
+        Single precision runs out of resolution once the mismatches approach its rounding error; recasting the state
+        lets the remaining iterations converge the rest of the way.
+        """
+        self._dtype = numpy.dtype(numpy.float64)
+        self._complex_dtype = numpy.dtype(numpy.complex128)
+        self._admittance_matrix = self._admittance_matrix.astype(self._complex_dtype)
+        self._scheduled_active_powers = self._scheduled_active_powers.astype(self._dtype)
+        self._scheduled_reactive_powers = self._scheduled_reactive_powers.astype(self._dtype)
+        self._magnitudes = self._magnitudes.astype(self._dtype)
+        self._angles = self._angles.astype(self._dtype)
+        self._voltages = self._magnitudes * numpy.exp(1j * self._angles)
+        self._currents = self._admittance_matrix @ self._voltages
+        self._compute_estimates()
+
+        if self._method == SolverMethod.FAST_DECOUPLED:
+            self._factor_decoupled_matrices()
+
+    def _fast_decoupled_corrections(self):
+        """Computes voltage corrections using the fast-decoupled approximation.
+
+        The coupling between active power and voltage magnitude, and between reactive power and phase angle, is weak
+        in well-conditioned transmission systems, so the Jacobian is approximated by the constant matrices B' and B''
+        factored at initialization. Each iteration then only requires two triangular solves
+
+            B' dtheta = dP / |V|
+            B'' d|V| = dQ / |V|
+
+        at the cost of somewhat slower convergence than the full Newton-Raphson method.
+
+        Returns:
+            An ordered list of voltage phase angle and magnitude corrections.
+        """
+        angle_corrections = scipy.linalg.lu_solve(
+            self._b_prime_factor,
+            self._active_power_errors[self._pv_pq_indices] / self._magnitudes[self._pv_pq_indices])
+        magnitude_corrections = scipy.linalg.lu_solve(
+            self._b_double_prime_factor,
+            self._reactive_power_errors[self._pq_indices] / self._magnitudes[self._pq_indices])
+        return numpy.concatenate([angle_corrections, magnitude_corrections])
 
     def _apply_corrections(self, corrections):
         """Applies a list of voltage corrections to each bus.
@@ -299,14 +396,16 @@ class PowerFlowSolver:
         Args:
             corrections: A list of voltage phase angle and magnitude corrections.
         """
-        angle_corrections = corrections[0:len(self._pv_pq_estimates)]
-        for c, e in zip(angle_corrections, self._pv_pq_estimates.values()):
-            magnitude = numpy.abs(e.bus.voltage)
-            angle = numpy.angle(e.bus.voltage) + c
-            e.bus.voltage = magnitude * numpy.exp(1j * angle)
-
-        magnitude_corrections = corrections[len(self._pv_pq_estimates):]
-        for c, e in zip(magnitude_corrections, self._pq_estimates.values()):
-            magnitude = numpy.abs(e.bus.voltage) + c
-            angle = numpy.angle(e.bus.voltage)
-            e.bus.voltage = magnitude * numpy.exp(1j * angle)
+        self._angles[self._pv_pq_indices] += corrections[0:len(self._pv_pq_indices)]
+        self._magnitudes[self._pq_indices] += corrections[len(self._pv_pq_indices):]
+
+        # Only the corrected buses changed, so the cached current vector can be updated with the voltage deltas
+        # instead of recomputing the full Y V product.
+        changed = self._pv_pq_indices
+        new_voltages = self._magnitudes[changed] * numpy.exp(1j * self._angles[changed])
+        deltas = new_voltages - self._voltages[changed]
+        self._voltages[changed] = new_voltages
+        self._currents += self._admittance_matrix[:, changed] @ deltas
+
+        for index, voltage in zip(changed, new_voltages):
+            self._system.buses[index].voltage = voltage
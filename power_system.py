@@ -9,6 +9,7 @@ power they consume, while generators are specified by the active power they inje
 
 import dataclasses
 import numpy
+import scipy.sparse
 import typing
 
 
@@ -38,23 +39,29 @@ class PowerSystem:
     buses: typing.List[Bus]
     lines: typing.List[Line]
 
-    def admittance_matrix(self):
+    def admittance_matrix(self, sparse=False):
         """Computes the admittance matrix for the system.
 
+        Admittance matrices are structurally sparse: each line contributes only four entries, so the number of
+        non-zeros grows with the number of lines rather than the square of the number of buses.
+
+        Args:
+            sparse: If true, the matrix is returned in compressed sparse row form.
+
         Returns:
             The admittance matrix for the system.
         """
-        matrix = numpy.zeros((len(self.buses), len(self.buses))) * 1j
-        for line in self.lines:
-            src = [index for index, bus in enumerate(self.buses) if bus.number == line.source][0]
-            dst = [index for index, bus in enumerate(self.buses) if bus.number == line.destination][0]
-
-            y_distributed = 1 / line.distributed_impedance
-            y_shunt = line.shunt_admittance
+        index_of = {bus.number: index for index, bus in enumerate(self.buses)}
+        src = numpy.array([index_of[line.source] for line in self.lines], dtype=int)
+        dst = numpy.array([index_of[line.destination] for line in self.lines], dtype=int)
+        y_distributed = 1 / numpy.array([line.distributed_impedance for line in self.lines], dtype=complex)
+        y_shunt = numpy.array([line.shunt_admittance for line in self.lines], dtype=complex)
+        y_self = y_distributed + y_shunt
 
-            matrix[src][dst] -= y_distributed
-            matrix[dst][src] -= y_distributed
-            matrix[src][src] += y_distributed + y_shunt
-            matrix[dst][dst] += y_distributed + y_shunt
+        rows = numpy.concatenate([src, dst, src, dst])
+        cols = numpy.concatenate([dst, src, src, dst])
+        values = numpy.concatenate([-y_distributed, -y_distributed, y_self, y_self])
 
-        return matrix
+        shape = (len(self.buses), len(self.buses))
+        matrix = scipy.sparse.coo_array((values, (rows, cols)), shape=shape).tocsr()
+        return matrix if sparse else matrix.toarray()
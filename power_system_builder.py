@@ -63,7 +63,7 @@ class ExcelPowerSystemBuilder(PowerSystemBuilder):
             start_voltage: The start voltage for PQ buses.
             power_base: The power base in MVA.
         """
-        self._workbook = openpyxl.load_workbook(filename, read_only=True)
+        self._workbook = openpyxl.load_workbook(filename, read_only=True, data_only=True)
         self._bus_data_worksheet = self._workbook[bus_data_worksheet_name]
         self._line_data_worksheet = self._workbook[line_data_worksheet_name]
         self._start_voltage = start_voltage
@@ -72,15 +72,15 @@ class ExcelPowerSystemBuilder(PowerSystemBuilder):
     def build_buses(self):
         """Builds a list of buses in the system."""
         result = []
-        for row in self._bus_data_worksheet.iter_rows(min_row=2):
-            bus_number = row[0].value
+        for row in self._bus_data_worksheet.iter_rows(min_row=2, values_only=True):
+            bus_number = row[0]
             if not bus_number:
                 break
 
-            p_load = (row[1].value or 0) / self._power_base
-            q_load = (row[2].value or 0) / self._power_base
-            p_generator = (row[3].value or 0) / self._power_base
-            p_voltage = row[4].value or self._start_voltage
+            p_load = (row[1] or 0) / self._power_base
+            q_load = (row[2] or 0) / self._power_base
+            p_generator = (row[3] or 0) / self._power_base
+            p_voltage = row[4] or self._start_voltage
             result.append(power_system.Bus(bus_number, p_load, q_load, p_generator, p_voltage))
 
         return result
@@ -88,17 +88,17 @@ class ExcelPowerSystemBuilder(PowerSystemBuilder):
     def build_lines(self):
         """Builds a list of lines in the system."""
         result = []
-        for row in self._line_data_worksheet.iter_rows(min_row=2):
-            source_bus_number = row[0].value
-            destination_bus_number = row[1].value
+        for row in self._line_data_worksheet.iter_rows(min_row=2, values_only=True):
+            source_bus_number = row[0]
+            destination_bus_number = row[1]
             if not source_bus_number or not destination_bus_number:
                 break
 
-            r_distributed = row[2].value or 0
-            x_distributed = row[3].value or 0
+            r_distributed = row[2] or 0
+            x_distributed = row[3] or 0
             z_distributed = r_distributed + 1j * x_distributed
-            y_shunt = 1j * row[4].value / 2 or 0j
-            max_power = row[5].value
+            y_shunt = 1j * row[4] / 2 or 0j
+            max_power = row[5]
 
             result.append(
                 power_system.Line(source_bus_number, destination_bus_number, z_distributed, y_shunt, max_power))
@@ -8,6 +8,21 @@ import tabulate
 TABULATE_FLOAT_FMT = '.4f'
 
 
+def _abs2(value):
+    """Computes the squared magnitude of a complex value.
+
+    This skips the square root taken by numpy.abs and is sufficient wherever magnitudes are only compared against
+    each other or against a squared limit.
+
+    Args:
+        value: The complex value.
+
+    Returns:
+        The squared magnitude of the value.
+    """
+    return value.real ** 2 + value.imag ** 2
+
+
 def bus_voltage_report(system, min_operating_voltage, max_operating_voltage):
     """Reports the voltage at each bus and whether the bus is outside operating limits.
 
@@ -17,12 +32,13 @@ def bus_voltage_report(system, min_operating_voltage, max_operating_voltage):
         max_operating_voltage: The maximum operating voltage.
     """
     headers = ['Bus', 'Voltage (V)', 'Phase (deg)', 'Outside Operating Limits']
-    table = []
-    for bus in system.buses:
-        voltage = numpy.abs(bus.voltage)
-        outside_limits = 'Yes' if voltage < min_operating_voltage or voltage > max_operating_voltage else 'No'
-        table.append([bus.number, numpy.abs(bus.voltage), numpy.rad2deg(numpy.angle(bus.voltage)), outside_limits])
+    voltages = numpy.array([bus.voltage for bus in system.buses])
+    magnitudes = numpy.abs(voltages)
+    angles = numpy.rad2deg(numpy.angle(voltages))
+    outside_limits = numpy.where((magnitudes < min_operating_voltage) | (magnitudes > max_operating_voltage),
+                                 'Yes', 'No')
 
+    table = zip([bus.number for bus in system.buses], magnitudes, angles, outside_limits)
     return tabulate.tabulate(table, headers=headers, floatfmt=TABULATE_FLOAT_FMT)
 
 
@@ -35,21 +51,24 @@ def line_power_report(system, power_base):
     """
     headers = ['Line', 'Sending Power (MW)', 'Sending Power (Mvar)', 'Sending Power (MVA)', 'Receiving Power (MW)',
                'Receiving Power (Mvar)', 'Receiving Power (MVA)', 'Exceeds Rating']
-    table = []
-    for line in system.lines:
-        src = next(filter(lambda bus: bus.number == line.source, system.buses))
-        dst = next(filter(lambda bus: bus.number == line.destination, system.buses))
-
-        i_src = (src.voltage - dst.voltage) / line.distributed_impedance + src.voltage * line.shunt_admittance
-        i_dst = (dst.voltage - src.voltage) / line.distributed_impedance + dst.voltage * line.shunt_admittance
-        s_src = power_base * src.voltage * numpy.conj(i_src)
-        s_dst = power_base * dst.voltage * numpy.conj(i_dst)
-
-        line_name = '{}-{}'.format(src.number, dst.number)
-        exceeds_rating = 'Yes' if line.max_power and max(s_src, s_dst) > line.max_power else 'No'
-        table.append([line_name, s_src.real, s_src.imag, numpy.abs(s_src), s_dst.real, s_dst.imag, numpy.abs(s_dst),
-                      exceeds_rating])
-
+    index_of = {bus.number: index for index, bus in enumerate(system.buses)}
+    voltages = numpy.array([bus.voltage for bus in system.buses])
+    src_voltages = voltages[[index_of[line.source] for line in system.lines]]
+    dst_voltages = voltages[[index_of[line.destination] for line in system.lines]]
+    impedances = numpy.array([line.distributed_impedance for line in system.lines], dtype=complex)
+    shunt_admittances = numpy.array([line.shunt_admittance for line in system.lines], dtype=complex)
+
+    src_currents = (src_voltages - dst_voltages) / impedances + src_voltages * shunt_admittances
+    dst_currents = (dst_voltages - src_voltages) / impedances + dst_voltages * shunt_admittances
+    src_powers = power_base * src_voltages * numpy.conj(src_currents)
+    dst_powers = power_base * dst_voltages * numpy.conj(dst_currents)
+
+    line_names = ['{}-{}'.format(line.source, line.destination) for line in system.lines]
+    exceeds_ratings = ['Yes' if line.max_power and max(_abs2(s_src), _abs2(s_dst)) > line.max_power ** 2 else 'No'
+                       for line, s_src, s_dst in zip(system.lines, src_powers, dst_powers)]
+
+    table = zip(line_names, src_powers.real, src_powers.imag, numpy.abs(src_powers), dst_powers.real,
+                dst_powers.imag, numpy.abs(dst_powers), exceeds_ratings)
     return tabulate.tabulate(table, headers=headers, floatfmt=TABULATE_FLOAT_FMT)
 
 
@@ -149,6 +149,47 @@ class TestPowerFlowSolver(unittest.TestCase):
         solver.step()
         self.assertTrue(solver.has_converged())
 
+    def test_solution_fast_decoupled_powell(self):
+        builder = power_system_builder.ExcelPowerSystemBuilder('data/Sample-Powell-3.1.xlsx')
+        solver = power_flow_solver.PowerFlowSolver(builder.build_system(),
+                                                   method=power_flow_solver.SolverMethod.FAST_DECOUPLED)
+        for _ in range(0, 20):
+            solver.step()
+
+        # Reference values taken from the converged Newton-Raphson solution.
+        expected_magnitudes = [1, 0.955306, 0.954818, 0.933334, 0.953394]
+        actual_magnitudes = [numpy.abs(i.voltage) for i in solver._system.buses]
+        numpy.testing.assert_array_almost_equal(actual_magnitudes, expected_magnitudes, 3)
+
+    def test_convergence_fast_decoupled_nptel(self):
+        builder = power_system_builder.ExcelPowerSystemBuilder('data/Sample-nptel.xlsx')
+        solver = power_flow_solver.PowerFlowSolver(builder.build_system(),
+                                                   method=power_flow_solver.SolverMethod.FAST_DECOUPLED)
+        for _ in range(0, 20):
+            solver.step()
+
+        self.assertTrue(solver.has_converged())
+
+        expected_magnitudes = [1.05, 0.9826, 0.9777, 0.9876, 1.02]
+        actual_magnitudes = [numpy.abs(i.voltage) for i in solver._system.buses]
+        numpy.testing.assert_array_almost_equal(actual_magnitudes, expected_magnitudes, 4)
+
+        expected_angles = [0, -5.0124, -7.1322, -7.3705, -3.2014]
+        actual_angles = [numpy.rad2deg(numpy.angle(i.voltage)) for i in solver._system.buses]
+        numpy.testing.assert_array_almost_equal(actual_angles, expected_angles, 4)
+
+    def test_solution_single_precision_nptel(self):
+        builder = power_system_builder.ExcelPowerSystemBuilder('data/Sample-nptel.xlsx')
+        solver = power_flow_solver.PowerFlowSolver(builder.build_system(), dtype=numpy.float32)
+        for _ in range(0, 10):
+            solver.step()
+
+        self.assertTrue(solver.has_converged())
+
+        expected_magnitudes = [1.05, 0.9826, 0.9777, 0.9876, 1.02]
+        actual_magnitudes = [numpy.abs(i.voltage) for i in solver._system.buses]
+        numpy.testing.assert_array_almost_equal(actual_magnitudes, expected_magnitudes, 3)
+
     def test_jacobian_11_nptel(self):
         solver = TestPowerFlowSolver.build_solver('data/Sample-nptel.xlsx')
         solver._compute_estimates()